@@ -16,7 +16,7 @@ import sys
 import os
 
 class GesturePresentationController:
-    def __init__(self):
+    def __init__(self, commit_certainty=0.6, evidence_half_life=0.15, min_support=0.12):
         # Initialize MediaPipe Hands
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
@@ -28,15 +28,28 @@ class GesturePresentationController:
         self.mp_draw = mp.solutions.drawing_utils
         
         # Gesture detection variables
-        self.gesture_buffer = deque(maxlen=5)
+        self.gesture_buffer = deque(maxlen=120)
         self.previous_landmarks = None
-        self.last_gesture_time = 0
-        self.gesture_cooldown = 1.0  # 1 second cooldown between gestures
         
-        # Timing variables for your 3-second requirement
-        self.finger_lift_time = 1
-        self.finger_lift_detected = False
-        self.gesture_window = 3.0  # 3 seconds to perform gesture after finger lift
+        # Temporal decision stage: time-decayed votes over gesture_buffer
+        self.evidence_half_life = evidence_half_life  # seconds until a frame's vote counts half
+        self.evidence_horizon = 1.0  # seconds of history kept in gesture_buffer
+        self.max_frame_time = 0.1  # cap on the seconds a single frame can vouch for
+        self.min_vote_confidence = 0.2  # frames below this detector confidence vote for no gesture
+        self.min_support = min_support  # decayed seconds a gesture must be held before it can fire
+        self.commit_certainty = commit_certainty  # fire once a gesture's share of the evidence reaches this
+        # Poses re-arm only after the neutral state (no hand in view or an
+        # unmapped pose such as two or three fingers) has been held the same way
+        self.gesture_armed = False
+        
+        # Motion gestures are single-frame events, so they bypass the vote and
+        # re-arm only after the hand has been still for motion_rearm_time
+        self.motion_gestures = ("swipe_left", "swipe_right", "pointing_down")
+        self.motion_confidence = 0.7
+        self.motion_rearm_time = 0.5  # seconds without motion before the next motion can fire
+        self.last_motion_time = 0
+        self.leading_gesture = None
+        self.gesture_certainty = 0.0
         
         # Camera and display
         self.cap = None
@@ -187,14 +200,74 @@ class GesturePresentationController:
         
         return gesture, confidence, extended_count
     
+    def accumulate_gesture_evidence(self, current_time):
+        """Sum time-decayed seconds of support per pose gesture in the buffer"""
+        # Drop frames that have decayed past the horizon
+        while self.gesture_buffer and current_time - self.gesture_buffer[0]['timestamp'] > self.evidence_horizon:
+            self.gesture_buffer.popleft()
+        
+        scores = {}
+        neutral_weight = 0.0
+        total_weight = 0.0
+        previous_time = None
+        
+        for entry in self.gesture_buffer:
+            # Each frame vouches for the time since the previous one, so the
+            # evidence is measured in seconds and does not depend on the fps
+            if previous_time is not None:
+                frame_time = min(entry['timestamp'] - previous_time, self.max_frame_time)
+                age = current_time - entry['timestamp']
+                weight = frame_time * 0.5 ** (age / self.evidence_half_life)
+                total_weight += weight
+                
+                gesture = entry['gesture']
+                if not gesture or entry['confidence'] < self.min_vote_confidence:
+                    neutral_weight += weight
+                elif gesture not in self.motion_gestures:
+                    scores[gesture] = scores.get(gesture, 0.0) + weight
+            previous_time = entry['timestamp']
+        
+        return scores, neutral_weight, total_weight
+    
+    def decide_gesture(self, gesture, confidence):
+        """Return a gesture to fire once its evidence is certain enough, else None"""
+        current_time = time.time()
+        scores, neutral_weight, total_weight = self.accumulate_gesture_evidence(current_time)
+        
+        if scores and total_weight > 0:
+            self.leading_gesture = max(scores, key=scores.get)
+            self.gesture_certainty = scores[self.leading_gesture] / total_weight
+        else:
+            self.leading_gesture = None
+            self.gesture_certainty = 0.0
+        
+        # Re-arm once the neutral state is as certain as a gesture must be to fire
+        if (not self.gesture_armed and neutral_weight >= self.min_support
+                and neutral_weight / total_weight >= self.commit_certainty):
+            self.gesture_armed = True
+        
+        # Any motion, fired or not, restarts the stillness timer, which also
+        # blocks jitter and the return stroke in the opposite direction
+        if gesture in self.motion_gestures:
+            motion_armed = current_time - self.last_motion_time >= self.motion_rearm_time
+            self.last_motion_time = current_time
+            if motion_armed and confidence >= self.motion_confidence:
+                return gesture
+            return None
+        
+        # Hold until released: no pose fires again before the neutral state
+        if not self.gesture_armed or self.leading_gesture is None:
+            return None
+        
+        if (scores[self.leading_gesture] >= self.min_support
+                and self.gesture_certainty >= self.commit_certainty):
+            self.gesture_armed = False
+            return self.leading_gesture
+        
+        return None
+    
     def execute_presentation_command(self, gesture):
         """Execute PowerPoint control commands"""
-        current_time = time.time()
-        
-        # Check cooldown
-        if current_time - self.last_gesture_time < self.gesture_cooldown:
-            return False
-        
         command_executed = False
         command_name = ""
         
@@ -229,34 +302,11 @@ class GesturePresentationController:
             command_executed = True
         
         if command_executed:
-            self.last_gesture_time = current_time
             self.detection_stats['gestures_detected'] += 1
             print(f"🎯 {command_name} - {datetime.now().strftime('%H:%M:%S')}")
         
         return command_executed
     
-    def check_finger_lift_trigger(self, extended_count, gesture ):
-        """Check for finger lift to start 3-second gesture window"""
-        current_time = time.time()
-
-        
-        # Detect finger lift (from closed fist to any gesture)
-        if not self.finger_lift_detected and extended_count > 0 and gesture == "pointing_up" :
-            # Check if we had a closed fist recently
-            recent_gestures = [g for g in self.gesture_buffer if g['extended_count'] == 0]
-            if recent_gestures:
-                self.finger_lift_detected = True
-                self.finger_lift_time = current_time
-                print(f"👆 Finger lift detected! You have 3 seconds to perform a gesture...")
-                return True
-        
-        # Reset if 3-second window expires
-        if self.finger_lift_detected and (current_time - self.finger_lift_time) > self.gesture_window:
-            self.finger_lift_detected = False
-            print("⏰ Gesture window expired. Lift finger again to start new window.")
-        
-        return self.finger_lift_detected
-    
     def draw_gesture_info(self, frame, gesture, confidence, extended_count):
         """Draw gesture information on frame"""
         h, w = frame.shape[:2]
@@ -292,15 +342,16 @@ class GesturePresentationController:
                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         y_offset += 20
         
-        # 3-second window status
-        window_text = "3s Window: " + ("ACTIVE" if self.finger_lift_detected else "WAITING")
-        window_color = (0, 255, 0) if self.finger_lift_detected else (255, 255, 255)
-        cv2.putText(frame, window_text, (20, y_offset), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, window_color, 1)
+        # Evidence status
+        state = "ARMED" if self.gesture_armed else "RELEASE"
+        evidence_text = f"Evidence: {self.leading_gesture or 'None'} {self.gesture_certainty:.2f} [{state}]"
+        evidence_color = (0, 255, 0) if self.gesture_armed else (255, 255, 255)
+        cv2.putText(frame, evidence_text, (20, y_offset), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, evidence_color, 1)
         
         # Instructions
         instructions = [
-            "Lift a finger and perform gesture within 3 seconds",
+            "Hold a gesture to fire it, drop your hand or show 2-3 fingers to re-arm",
             "✋ Open Palm: Play/Pause | ✊ Fist: Stop",
             "☝️ Point Up: Next | 👇 Point Down: Previous",
             "👍 Thumbs Up: Zoom | ✌️ Peace: Pointer",
@@ -347,7 +398,7 @@ class GesturePresentationController:
         print("📊 Statistics will appear in the top-right corner")
         print("❓ Instructions are displayed on the left side")
         print("\n⚠️  Make sure PowerPoint is open and in presentation mode!")
-        print("\n🔄 Looking for finger lift to trigger 3-second gesture window...")
+        print("\n🔄 Hold a gesture until it fires, then drop your hand or show 2-3 fingers to re-arm...")
         
         try:
             while True:
@@ -381,23 +432,23 @@ class GesturePresentationController:
                     # Detect gesture
                     gesture, confidence, extended_count = self.detect_gesture(landmarks)
                     
-                    # Add to gesture buffer
-                    self.gesture_buffer.append({
-                        'gesture': gesture,
-                        'confidence': confidence,
-                        'extended_count': extended_count,
-                        'timestamp': time.time()
-                    })
-                    
-                    # Check for finger lift trigger
-                    finger_lift_active = self.check_finger_lift_trigger(extended_count, gesture)
-                    
-                    # Execute command if gesture detected and window is active
-                    if gesture and finger_lift_active and confidence > 0.7:
-                        self.execute_presentation_command(gesture)
-                    
                     # Draw hand landmarks
                     self.mp_draw.draw_landmarks(frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
+                else:
+                    # Forget the last position so a returning hand is not read as a swipe
+                    self.previous_landmarks = None
+                
+                # Add to gesture buffer (frames without a hand vote for no gesture)
+                self.gesture_buffer.append({
+                    'gesture': gesture,
+                    'confidence': confidence,
+                    'timestamp': time.time()
+                })
+                
+                # Execute command once accumulated evidence is certain enough
+                decided_gesture = self.decide_gesture(gesture, confidence)
+                if decided_gesture:
+                    self.execute_presentation_command(decided_gesture)
                 
                 # Update statistics
                 self.detection_stats['total_frames'] += 1
@@ -416,7 +467,10 @@ class GesturePresentationController:
                     break
                 elif key == ord('r'):
                     print("\n🔄 Resetting gesture detection...")
-                    self.finger_lift_detected = False
+                    self.gesture_armed = False
+                    self.last_motion_time = 0
+                    self.leading_gesture = None
+                    self.gesture_certainty = 0.0
                     self.gesture_buffer.clear()
                     self.previous_landmarks = None
         
@@ -457,8 +511,8 @@ def main():
     print("  - PowerPoint open and in presentation mode")
     print("  - Python packages: opencv-python, mediapipe, pyautogui, numpy")
     print("\nHow it works:")
-    print("  1. Lift a finger to start 3-second gesture window")
-    print("  2. Perform gesture within 3 seconds")
+    print("  1. Hold a gesture until it fires")
+    print("  2. Drop your hand out of view or show 2-3 fingers to re-arm")
     print("  3. System automatically controls PowerPoint")
     print("\nPress Ctrl+C to quit")
     
@@ -36,8 +36,8 @@ echo =======================
 echo 1. Make sure PowerPoint is open with your presentation
 echo 2. Start presentation mode (F5 or Shift+F5)
 echo 3. Position your hand in front of the camera
-echo 4. Lift a finger to activate the 3-second gesture window
-echo 5. Perform a gesture within 3 seconds
+echo 4. Hold a gesture until it fires
+echo 5. Drop your hand out of view or show 2-3 fingers to re-arm
 echo 6. Watch as PowerPoint responds to your gestures!
 echo.
 echo 🎯 Gestures:
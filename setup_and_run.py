@@ -105,8 +105,8 @@ def provide_usage_instructions():
     print("2. Start the presentation mode (F5 or Shift+F5)")
     print("3. Run this application")
     print("4. Position your hand in front of the camera")
-    print("5. Lift a finger to activate the 3-second gesture window")
-    print("6. Perform a gesture within 3 seconds")
+    print("5. Hold a gesture until it fires")
+    print("6. Drop your hand out of view or show 2-3 fingers to re-arm")
     print("7. Watch as PowerPoint responds to your gestures!")
     
     print("\n🎯 Gesture Commands:")